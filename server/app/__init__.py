@@ -1,12 +1,89 @@
+import json
+
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO
 
+# orjson is optional, jsonify falls back to Flask's stdlib json provider without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _unserializable(obj):
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _as_builtin(obj, fallback):
+    """orjson default hook: encode builtin subclasses (numpy floats, IntEnum, ...) like the stdlib does."""
+    for base in (float, int, str, dict):
+        if isinstance(obj, base):
+            return base(obj)
+    if isinstance(obj, (list, tuple)):
+        return list(obj)
+    return fallback(obj)
+
+
+if orjson is not None:
+    # Subclasses and datetimes go through the default hook, so they encode as the stdlib json would
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+                       | orjson.OPT_PASSTHROUGH_DATETIME)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson.
+
+    Output decodes to the same values as DefaultJSONProvider, except that NaN and
+    Infinity become null (the stdlib writes NaN, which browsers' JSON.parse rejects)
+    and non-ASCII text is sent as UTF-8 instead of \\u escapes. Anything orjson
+    cannot encode, such as integers past 64 bits, is handed to the stdlib provider.
+    """
+
+    def _default(self, obj):
+        return _as_builtin(obj, self.default)
+
+    def dumps(self, obj, **kwargs):
+        option = _ORJSON_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self._default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class ORJSONSocketSerializer:
+    """json module stand-in for python-socketio, which sends every game update."""
+
+    @staticmethod
+    def _default(obj):
+        return _as_builtin(obj, _unserializable)
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # Same fallbacks as ORJSONProvider, with the stdlib json module as the last resort
+        try:
+            return orjson.dumps(obj, default=ORJSONSocketSerializer._default, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 # Global SocketIO instance
 socketio = SocketIO()
 
 def create_app():
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
     
     # Configure static file caching for better performance
     app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000  # 1 year cache for static files
@@ -20,7 +97,11 @@ def create_app():
     async_mode = 'threading'
     print("🔌 Using threading mode for WebSocket support (Python 3.13 compatible)")
     
+    # Socket.IO packets use the stdlib json module unless given another one
+    json_options = {'json': ORJSONSocketSerializer} if orjson is not None else {}
+    
     socketio.init_app(app, 
+                     **json_options,
                      cors_allowed_origins="*", 
                      async_mode=async_mode,
                      # Railway-specific optimizations
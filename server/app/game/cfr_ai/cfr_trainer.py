@@ -255,9 +255,8 @@ class NeuralCFRTrainer:
     
     def create_random_game_state(self) -> GameState:
         """Create a random game state for training"""
-        # Create deck and deal cards
-        deck = create_deck()
-        random.shuffle(deck)
+        # Create deck and deal cards, only the 4 hole cards and 5 board cards are ever drawn
+        deck = random.sample(create_deck(), 9)
         
         # Deal hole cards
         player_hands = [
@@ -63,53 +63,48 @@ class BetAbstraction:
     def get_legal_actions(self, street: str, pot_size: float, stack_size: float, 
                          facing_bet: bool = False) -> List[str]:
         """Get legal betting actions for current situation"""
-        actions = []
-        
-        if facing_bet:
-            actions.append('fold')
-            actions.append('call')
-        else:
-            # Preflop first action (SB) cannot check; allow fold/call
-            if street == 'preflop':
-                actions.append('fold')
-                actions.append('call')
-            else:
-                actions.append('check')
-            
-        # Add bet/raise actions
-        # Build action list by context and street
-        if street == 'preflop':
-            if facing_bet:
-                # Preflop vs raise: 3x or 5x opponent bet (use tokens raise_3.0, raise_5.0)
-                candidate = ['raise_3.0', 'raise_5.0']
+        return list(_LEGAL_ACTIONS[street == 'preflop', facing_bet])
+
+
+def _build_legal_actions() -> Dict[Tuple[bool, bool], Tuple[str, ...]]:
+    """Precompute the legal action tuple for each (is_preflop, facing_bet) spot.
+
+    Only the street and whether a bet is faced decide the action set; sizes
+    are resolved later by the conversion layer, so the table is built once.
+    """
+    try:
+        from .action_space import ACTION_MAP
+        allowed = set(ACTION_MAP.keys())
+    except Exception:
+        allowed = None
+
+    table = {}
+    for is_preflop in (True, False):
+        for facing_bet in (True, False):
+            if facing_bet or is_preflop:
+                # Preflop first action (SB) cannot check; allow fold/call
+                actions = ['fold', 'call']
             else:
-                # Preflop first-in: 2.5x BB
-                candidate = ['raise_2.5']
-        else:
-            if facing_bet:
-                # Postflop vs raise: raise to 2.3x or 3.5x of opponent bet
-                candidate = ['raise_2.3', 'raise_3.5']
+                actions = ['check']
+
+            if is_preflop:
+                # Preflop vs raise: 3x or 5x opponent bet; first-in: 2.5x BB
+                actions += ['raise_3.0', 'raise_5.0'] if facing_bet else ['raise_2.5']
             else:
-                # Postflop first-in: 35%, 70%, 110% pot
-                candidate = ['raise_0.35', 'raise_0.7', 'raise_1.1']
+                # Postflop vs raise: raise to 2.3x or 3.5x of opponent bet;
+                # first-in: 35%, 70%, 110% pot
+                actions += (['raise_2.3', 'raise_3.5'] if facing_bet
+                            else ['raise_0.35', 'raise_0.7', 'raise_1.1'])
 
-        # Add the candidate raise tokens. Amount legality is enforced later.
-        for token in candidate:
-            try:
-                # Keep token; amount is computed later by conversion layer
-                actions.append(token)
-            except Exception:
-                continue
+            # Filter actions to the unified action space
+            if allowed is not None:
+                actions = [a for a in actions if a in allowed]
+            table[is_preflop, facing_bet] = tuple(actions)
+    return table
 
-        # Filter actions to the unified action space
-        try:
-            from .action_space import ACTION_MAP
-            allowed = set(ACTION_MAP.keys())
-            actions = [a for a in actions if a in allowed]
-        except Exception:
-            pass
 
-        return actions
+_LEGAL_ACTIONS = _build_legal_actions()
+
 
 class GameAbstraction:
     """Main game abstraction system combining card and bet abstractions"""
@@ -85,8 +85,8 @@ def create_random_game_state():
     # Generate random cards
     suits = ['s', 'h', 'd', 'c']
     ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-    deck = [r + s for r in ranks for s in suits]
-    random.shuffle(deck)
+    # Only the 4 hole cards and 5 board cards are ever drawn
+    deck = random.sample([r + s for r in ranks for s in suits], 9)
     
     # Deal cards
     player_hands = [[deck.pop(), deck.pop()] for _ in range(2)]
@@ -14,7 +14,7 @@ from .cfr_trainer import create_trainer
 from .deep_cfr import create_deep_cfr_trainer
 from .cfr_bot import create_cfr_bot, create_trained_cfr_bot
 from ..hardcode_ai.ai_bladework_v2 import decide_action_bladeworkv2
-from ..poker import start_new_game, apply_action, betting_round_over, advance_round, next_player, showdown, prepare_next_hand, deal_remaining_cards
+from ..poker import start_new_game, apply_action, betting_round_over, advance_round, next_player, showdown, prepare_next_hand, deal_remaining_cards, to_chips, ACTIVE, IN_HAND
 
 def train_basic_cfr(iterations: int = 100000, simplified: bool = True):
     """Train basic Neural CFR"""
@@ -340,6 +340,7 @@ def _legalize_for_apply(state: dict, idx: int, action: str, amount: int):
 def _apply_with_fallback(state: dict, idx: int, action: str, amount: int):
     """Apply action with robust legality fallback based on to_call."""
     action, amount = _legalize_for_apply(state, idx, action, amount)
+    amount = to_chips(amount)
     try:
         apply_action(state, action, amount)
         return
@@ -371,12 +372,8 @@ def match(bot1: str, bot2: str, model1: Optional[str], model2: Optional[str], ha
     b2 = create_cfr_bot(model_path=model2, simplified=True) if bot2 == 'cfr' else None
 
     # Start game
-    gs = start_new_game()
-    # Disable hand-history file writes to avoid I/O stalls
-    try:
-        gs['hand_history_path'] = os.devnull
-    except Exception:
-        pass
+    # No hand-history file, log_to_hand_history skips a falsy path without opening anything
+    gs = start_new_game(hand_history=False)
     # Rename players for clarity
     gs['players'][0]['name'] = 'Bot1'
     gs['players'][1]['name'] = 'Bot2'
@@ -390,16 +387,14 @@ def match(bot1: str, bot2: str, model1: Optional[str], model2: Optional[str], ha
         steps = 0
         while True:
             # Terminal check: one active player or showdown marker via engine conditions
-            players_active = [p for p in gs['players'] if p['status'] in ['active', 'all-in']]
-            if len(players_active) <= 1:
+            if sum(p['status'] in IN_HAND for p in gs['players']) <= 1:
                 winners = showdown(gs)
                 # Profits accounted inside engine pot distribution; we'll compute deltas after hand
                 break
 
             # If betting round is over, handle advancement/all-in showdown
             if betting_round_over(gs):
-                active_players = [p for p in gs['players'] if p['status'] == 'active']
-                if not active_players:
+                if not any(p['status'] == ACTIVE for p in gs['players']):
                     deal_remaining_cards(gs)
                     winners = showdown(gs)
                     break
@@ -465,7 +460,7 @@ def match_series(bot1: str, bot2: str, model1: Optional[str], model2: Optional[s
     total_chip_diff = 0
 
     for m in range(1, matches + 1):
-        gs = start_new_game()
+        gs = start_new_game(hand_history=False)
         gs['players'][0]['name'] = 'Bot1'
         gs['players'][1]['name'] = 'Bot2'
 
@@ -473,13 +468,11 @@ def match_series(bot1: str, bot2: str, model1: Optional[str], model2: Optional[s
         while hands_played < max_hands and gs['players'][0]['stack'] > 0 and gs['players'][1]['stack'] > 0:
             # Play a single hand to completion
             while True:
-                players_active = [p for p in gs['players'] if p['status'] in ['active', 'all-in']]
-                if len(players_active) <= 1:
+                if sum(p['status'] in IN_HAND for p in gs['players']) <= 1:
                     showdown(gs)
                     break
                 if betting_round_over(gs):
-                    active_players = [p for p in gs['players'] if p['status'] == 'active']
-                    if not active_players:
+                    if not any(p['status'] == ACTIVE for p in gs['players']):
                         deal_remaining_cards(gs)
                         showdown(gs)
                         break
@@ -5,4 +5,6 @@ NUM_PLAYERS = 2  # Logic only supports 2 players for now
 STARTING_STACK = 1000    
 SMALL_BLIND = 5
 BIG_BLIND = 10
-ANTE = 0 
\ No newline at end of file
+ANTE = 0 
+
+DEBUG = False  # Print side pot and showdown chip traces to stdout
@@ -1,25 +1,105 @@
+from functools import lru_cache
+from itertools import combinations
+
 from treys import Card, Evaluator
+from treys.lookup import LookupTable
 
 evaluator = Evaluator()
 
+# Treys integer for every card string, so evaluation never re-parses 'As' style cards
+CARD_TO_INT = {r + s: Card.new(r + s) for r in '23456789TJQKA' for s in 'shdc'}
+# Cards that are already treys ints map to themselves, so callers can hold either form
+CARD_TO_INT.update({card_int: card_int for card_int in list(CARD_TO_INT.values())})
+
+# Hand class name for every possible score, indexed by score (1 = royal flush .. 7462 = worst high card)
+SCORE_TO_CLASS = ('',) + tuple(
+    evaluator.class_to_string(evaluator.get_rank_class(score))
+    for score in range(1, LookupTable.MAX_HIGH_CARD + 1)
+)
+
+def hand_to_ints(cards):
+    """Converts card strings (or treys ints, passed through) to treys integers via the precomputed table."""
+    return [CARD_TO_INT[card] for card in cards]
+
+_FLUSH_LOOKUP = evaluator.table.flush_lookup
+_UNSUITED_LOOKUP = evaluator.table.unsuited_lookup
+_SUIT_BITS = (0x1000, 0x2000, 0x4000, 0x8000)
+_SEVEN_CHOOSE_FIVE = tuple(combinations(range(7), 5))
+
+def _score_seven(cards):
+    """
+    Best 5-card treys score out of 7 card ints.
+
+    Same result as treys' 7-card path, but the suit test runs once over all 7 cards instead of
+    once per 5-card subset: flush lookups only happen for the subsets of a suit with 5+ cards,
+    every other subset is a single prime product lookup.
+    """
+    primes = [card & 0xFF for card in cards]
+    best = LookupTable.MAX_HIGH_CARD
+    for a, b, c, d, e in _SEVEN_CHOOSE_FIVE:
+        score = _UNSUITED_LOOKUP[primes[a] * primes[b] * primes[c] * primes[d] * primes[e]]
+        if score < best:
+            best = score
+
+    for suit_bit in _SUIT_BITS:
+        suited = [card for card in cards if card & suit_bit]
+        if len(suited) >= 5:
+            for combo in combinations(suited, 5):
+                rank_bits = (combo[0] | combo[1] | combo[2] | combo[3] | combo[4]) >> 16
+                score = _FLUSH_LOOKUP[Card.prime_product_from_rankbits(rank_bits)]
+                if score < best:
+                    best = score
+            break  # only one suit can have 5 of 7 cards
+    return best
+
+@lru_cache(maxsize=1 << 16)
+def _score_sorted(cards):
+    """Treys score for a sorted tuple of card ints, the score only depends on the set of cards."""
+    if len(cards) == 7:
+        return _score_seven(cards)
+    return evaluator.evaluate(list(cards), [])
+
+def evaluate_ints(hand_ints, board_ints):
+    """
+    Evaluates a hand whose cards are already treys integers.
+
+    Lets callers convert the board once and reuse it for every player or run-out.
+
+    Returns:
+        int: Treys score (lower is better)
+        str: Human-readable hand class
+    """
+    score = _score_sorted(tuple(sorted(hand_ints + board_ints)))
+    return score, SCORE_TO_CLASS[score]
+
+def evaluate_hands(hands, community):
+    """
+    Evaluates several hands against the same board, converting the board only once.
+
+    Args:
+        hands (list): hole card pairs, one per player
+        community (list): the shared board
+
+    Returns:
+        list: (score, hand_class) per hand, in the same order
+    """
+    board_ints = hand_to_ints(community)
+    return [evaluate_ints(hand_to_ints(hand), board_ints) for hand in hands]
+
 def evaluate_hand(player_hand, community):
     """
     Evaluates a Texas Hold'em hand using treys.
 
     Args:
-        player_hand (list): 2 hole cards, ['As', 'Kd']
-        community (list): up to 5 community cards, ['2c', '5h', '9s', 'Jh', '7d']
+        player_hand (list): 2 hole cards, ['As', 'Kd'] or their treys ints
+        community (list): up to 5 community cards, ['2c', '5h', '9s', 'Jh', '7d'] or their treys ints
 
     Returns:
         int: Treys score (lower is better; 1 is Royal Flush, ~7000 is worst high card)
         str: Human-readable hand class (e.g., "Pair", "Full House", etc.)
     """
     # Convert card strings to treys format 
-    treys_hand = [Card.new(card) for card in player_hand]
-    treys_board = [Card.new(card) for card in community]
-    score = evaluator.evaluate(treys_hand, treys_board)
-    hand_class = evaluator.class_to_string(evaluator.get_rank_class(score))
-    return score, hand_class
+    return evaluate_ints(hand_to_ints(player_hand), hand_to_ints(community))
 
 # small test code
 if __name__ == "__main__":
@@ -9,16 +9,25 @@ also checks for draw analysis and blockers
 import random
 import itertools
 try:
-    from ..hand_eval_lib import evaluate_hand
+    from ..hand_eval_lib import evaluate_hand, evaluate_hands
 except ImportError:
     try:
-        from hand_eval_lib import evaluate_hand
+        from hand_eval_lib import evaluate_hand, evaluate_hands
     except ImportError:
         # Fallback if hand_eval_lib is not available
         def evaluate_hand(hand, board):
             # Simple fallback evaluation
             return 5000, "Unknown"
 
+        def evaluate_hands(hands, board):
+            return [evaluate_hand(hand, board) for hand in hands]
+
+# Private generator for the equity rollouts, same idea as the engine's deck RNG
+_rng = random.Random()
+
+# Every equity call starts from the full deck, build the card strings once
+_FULL_DECK = tuple(r + s for r in '23456789TJQKA' for s in 'shdc')
+
 class PostflopStrategy:
     def __init__(self):
         self.card_values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, 
@@ -52,30 +61,39 @@ class PostflopStrategy:
             valid_villain_hands = list(itertools.combinations(available_cards, 2))
 
 
+        # Cards left for the runout don't change between simulations, build the list once
+        deck_after_hero = [card for card in deck if card not in used_cards]
+        cards_to_deal = 5 - len(board)
+        if len(deck_after_hero) < cards_to_deal:
+            return 0.5
+
+        sample = _rng.sample
+        choice = _rng.choice
         for i in range(num_simulations):
             
             # 1. Sample a random board completion
-            deck_after_hero = [card for card in deck if card not in used_cards]
-            
-            cards_to_deal = 5 - len(board)
-            if len(deck_after_hero) < cards_to_deal: continue
-
-            board_completion = random.sample(deck_after_hero, cards_to_deal)
+            board_completion = sample(deck_after_hero, cards_to_deal)
             full_board = board + board_completion
             
             # 2. Sample a villain hand from their valid range
-            current_used_cards = used_cards.union(board_completion)
-            
-            runout_valid_villain_hands = [h for h in valid_villain_hands if not any(c in current_used_cards for c in h)]
-            if not runout_valid_villain_hands:
-                continue # No valid opponent hands for this runout
-
-            villain_hand = random.choice(runout_valid_villain_hands)
+            # Redraw on a clash with the runout instead of refiltering the whole range every time,
+            # only fall back to the filter when the range is mostly blocked
+            villain_hand = None
+            for _ in range(10):
+                candidate = choice(valid_villain_hands)
+                if not any(c in board_completion for c in candidate):
+                    villain_hand = candidate
+                    break
+            if villain_hand is None:
+                runout_valid_villain_hands = [h for h in valid_villain_hands if not any(c in board_completion for c in h)]
+                if not runout_valid_villain_hands:
+                    continue # No valid opponent hands for this runout
+                villain_hand = choice(runout_valid_villain_hands)
 
             # 3. Evaluate hands
             try:
-                hero_score, _ = evaluate_hand(hero_hand, full_board)
-                villain_score, _ = evaluate_hand(list(villain_hand), full_board)
+                # Both hands share the runout, so the board is converted once for the pair
+                (hero_score, _), (villain_score, _) = evaluate_hands((hero_hand, villain_hand), full_board)
 
                 if hero_score < villain_score:
                     wins += 1
@@ -120,9 +138,14 @@ class PostflopStrategy:
         if not villain_hands:
             return 0.5 # No possible hands for villain
 
+        # Board is complete, so hero's score is the same against every villain hand
+        try:
+            hero_score, _ = evaluate_hand(hero_hand, board)
+        except Exception:
+            return 0.5
+
         for villain_hand in villain_hands:
             try:
-                hero_score, _ = evaluate_hand(hero_hand, board)
                 villain_score, _ = evaluate_hand(list(villain_hand), board)
                 
                 if hero_score < villain_score:  # Lower score wins in treys
@@ -284,9 +307,7 @@ class PostflopStrategy:
     
     def create_deck(self):
         """Create standard 52-card deck"""
-        suits = ['s', 'h', 'd', 'c']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-        return [r + s for r in ranks for s in suits]
+        return list(_FULL_DECK)
 
     def convert_range_tuples_to_hands(self, range_tuples):
         """
@@ -22,7 +22,6 @@ Could be improved by adding different percentages for each action for tiers to i
 """
 from typing import List, Tuple, Dict, Optional
 from .tier_config import TIERS, class_lookup
-import random
 
 RANK_TO_INT = {"2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7,
                "8": 8, "9": 9, "T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
@@ -32,9 +31,7 @@ INT_TO_RANK = {v: k for k, v in RANK_TO_INT.items()}
 # Utility functions
 # ---------------------------------------------------------------------------
 
-def hand_to_tuple(hand: List[str]) -> Tuple[int, int, bool]:
-    """Convert ['Ah','Kd'] to (14, 13, False)"""
-    c1, c2 = hand
+def _card_pair_to_tuple(c1: str, c2: str) -> Tuple:
     r1, s1 = c1[0], c1[1]
     r2, s2 = c2[0], c2[1]
     v1, v2 = RANK_TO_INT[r1], RANK_TO_INT[r2]
@@ -42,6 +39,20 @@ def hand_to_tuple(hand: List[str]) -> Tuple[int, int, bool]:
         return (v1, v1)
     return (max(v1, v2), min(v1, v2), s1 == s2)
 
+# Only 52x52 card pairs exist, so map every one to its hand class and tier up front
+_CARDS = [r + s for r in RANK_TO_INT for s in "shdc"]
+_HAND_TUPLES: Dict[Tuple[str, str], Tuple] = {
+    (c1, c2): _card_pair_to_tuple(c1, c2) for c1 in _CARDS for c2 in _CARDS
+}
+_HAND_TIERS: Dict[Tuple[str, str], int] = {
+    pair: class_lookup[tup] for pair, tup in _HAND_TUPLES.items()
+}
+
+def hand_to_tuple(hand: List[str]) -> Tuple[int, int, bool]:
+    """Convert ['Ah','Kd'] to (14, 13, False)"""
+    c1, c2 = hand
+    return _HAND_TUPLES[c1, c2]
+
 def categorize_bet_size(bet_size_bb: float, previous_bet_bb: float = 1.0) -> str:
     """
     Categorize bet size based on multiple of previous bet
@@ -92,6 +103,105 @@ def categorize_stack_depth(stack_bb: int) -> str:
     else:
         return "deep"
 
+# ---------------------------------------------------------------------------
+# Strategy tables (max tier per action), shared by every PreflopCharts
+# ---------------------------------------------------------------------------
+
+# SB RFI ranges by stack depth
+SB_RFI_RANGES = {
+    "short": 7,    # RFI less hands when short stacked
+    "medium": 8,
+    "deep": 8
+}
+
+# BB vs SB limp: which hands to raise
+BB_VS_LIMP_RAISE_RANGE = 6  # tiers 0-6 (~70%)
+
+# BB defense vs SB raise - more granular based on raise size
+BB_DEFENSE_RANGES = {
+    "minraise": {
+        "call": 7,    # 7 means tiers 4-7
+        "3bet": 3     # 3 means 0-3
+    },
+    "standard_low": {
+        "call": 6,
+        "3bet": 3
+    },
+    "standard": {
+        "call": 5,
+        "3bet": 2
+    },
+    "large": {
+        "call": 3,
+        "3bet": 2
+    },
+    "overbet": {
+        "call": 1,
+        "3bet": 0      # Nuts only
+    }
+}
+
+# SB vs BB 3-bet responses
+SB_VS_3BET_RANGES = {
+    "minraise": {  # BB 3-bet is small
+        "call": 6,
+        "4bet": 3
+    },
+    "standard_low": {
+        "call": 4,
+        "3bet": 1
+    },
+    "standard": {
+        "call": 3,
+        "4bet": 0
+    },
+    "large": {
+        "call": 1,
+        "4bet": 0
+    },
+    "overbet": {
+        "call": 1,
+        "4bet": 0
+    }
+}
+
+# BB vs SB 4-bet responses
+BB_VS_4BET_RANGES = {
+    "standard_low": {
+        "call": 1,
+        "5bet": 0
+    },
+    "standard": {
+        "call": 1,
+        "5bet": 0
+    },
+    "large": {
+        "5bet": 0
+    },
+    "overbet": {
+        "5bet": 0
+    }
+}
+
+# SB vs BB 5-bet responses - sizing dependent
+SB_VS_5BET_RANGES = {
+    "minraise": {
+        "call": 2
+    },
+    "standard_low": {
+        "call": 1
+    },
+    "standard": {
+        "call": 1
+    },
+    "large": {
+        "call": 0
+    },
+    "overbet": {
+        "call": 0
+    }
+}
+
 # ---------------------------------------------------------------------------
 # Main preflop decision engine
 # ---------------------------------------------------------------------------
@@ -101,100 +211,13 @@ class PreflopCharts:
         self._build_strategy_tables()
 
     def _build_strategy_tables(self):
-        # SB RFI ranges by stack depth
-        self.sb_rfi_ranges = {
-            "short": 7,    # RFI less hands when short stacked
-            "medium": 8,   
-            "deep": 8     
-        }
-        
-        # BB vs SB limp: which hands to raise
-        self.bb_vs_limp_raise_range = 6  # tiers 0-6 (~70%)
-        
-        # BB defense vs SB raise - more granular based on raise size
-        self.bb_defense_ranges = {
-            "minraise": {
-                "call": 7,    # 7 means tiers 4-7
-                "3bet": 3     # 3 means 0-3
-            },
-            "standard_low": {
-                "call": 6,   
-                "3bet": 3     
-            },
-            "standard": {
-                "call": 5,     
-                "3bet": 2      
-            },
-            "large": {
-                "call": 3,     
-                "3bet": 2     
-            },
-            "overbet": {
-                "call": 1,   
-                "3bet": 0      # Nuts only
-            }
-        }
-        
-        # SB vs BB 3-bet responses
-        self.sb_vs_3bet_ranges = {
-            "minraise": {  # BB 3-bet is small
-                "call": 6,     
-                "4bet": 3     
-            },
-            "standard_low": {
-                "call": 4,    
-                "3bet": 1     
-            },
-            "standard": {  
-                "call": 3,    
-                "4bet": 0     
-            },
-            "large": {  
-                "call": 1,    
-                "4bet": 0      
-            },
-            "overbet": {  
-                "call": 1,     
-                "4bet": 0    
-            }
-        }
-        
-        # BB vs SB 4-bet responses  
-        self.bb_vs_4bet_ranges = {
-            "standard_low": {
-                "call": 1,    
-                "5bet": 0      
-            },
-            "standard": {
-                "call": 1,   
-                "5bet": 0    
-            },
-            "large": {
-                "5bet": 0    
-            },
-            "overbet": {
-                "5bet": 0    
-            }
-        }
-        
-        # SB vs BB 5-bet responses - sizing dependent
-        self.sb_vs_5bet_ranges = {
-            "minraise": {   
-                "call": 2  
-            },
-            "standard_low": { 
-                "call": 1     
-            },
-            "standard": {    
-                "call": 1    
-            },
-            "large": {       
-                "call": 0    
-            },
-            "overbet": {      
-                "call": 0     
-            }
-        }
+        # The tables never change, so instances point at the module ones instead of rebuilding them
+        self.sb_rfi_ranges = SB_RFI_RANGES
+        self.bb_vs_limp_raise_range = BB_VS_LIMP_RAISE_RANGE
+        self.bb_defense_ranges = BB_DEFENSE_RANGES
+        self.sb_vs_3bet_ranges = SB_VS_3BET_RANGES
+        self.bb_vs_4bet_ranges = BB_VS_4BET_RANGES
+        self.sb_vs_5bet_ranges = SB_VS_5BET_RANGES
 
     # ---------------------------------------------------------------------------
     # Public utility methods
@@ -210,7 +233,8 @@ class PreflopCharts:
 
     def get_hand_tier(self, hand: List[str]) -> int:
         """Get tier index for a hand"""
-        return self.tier_of(self.get_hand_tuple(hand))
+        c1, c2 = hand
+        return _HAND_TIERS[c1, c2]
 
     # ---------------------------------------------------------------------------
     # Scenario-specific decision methods
@@ -1,6 +1,9 @@
+import os
+import math
 import random
-from .hand_eval_lib import evaluate_hand
-from .config import NUM_PLAYERS, STARTING_STACK, SMALL_BLIND, BIG_BLIND, ANTE
+from datetime import datetime
+from .hand_eval_lib import evaluate_hands
+from .config import NUM_PLAYERS, STARTING_STACK, SMALL_BLIND, BIG_BLIND, ANTE, DEBUG
 
 """
 Main file for core poker game engine and logic
@@ -20,53 +23,90 @@ Supports ante if added in ./config.py
 Built for real-time multiplayer poker games with WebSocketcommunication
 """
 
+# Player statuses, kept as strings since game_state is sent to the client as is
+ACTIVE, FOLDED, ALL_IN, OUT = 'active', 'folded', 'all-in', 'out'
+IN_HAND = frozenset((ACTIVE, ALL_IN))
+
+
+# Card strings never change, so build them once and copy decks from this template
+_SUITS = ('s', 'h', 'd', 'c')
+_RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A')
+_BASE_DECK = tuple(r + s for r in _RANKS for s in _SUITS)
 
 def create_deck():
     """Creates a standard 52-card deck with suits (s,h,d,c) and ranks (2-A)."""
-    suits = ['s', 'h', 'd', 'c']
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-    return [r + s for r in ranks for s in suits]
+    return list(_BASE_DECK)
+
+# Engine's own PRNG for shuffling and seating, seed it to replay games without touching
+# the global random state the AIs draw from
+_rng = random.Random()
+
+def _reshuffle_deck(deck):
+    """Refills an existing deck list in place with all 52 cards in a fresh random order."""
+    # sample over the tuple template shuffles without building an intermediate list
+    deck[:] = _rng.sample(_BASE_DECK, len(_BASE_DECK))
+    return deck
 
 def deal_cards(deck, num_players=NUM_PLAYERS):
     """Deals 2 hole cards to each player from the deck."""
-    return [[deck.pop(), deck.pop()] for _ in range(num_players)]
+    # Take every hole card in one slice, reversed so each pair comes out in pop order
+    num_cards = 2 * num_players
+    drawn = deck[-num_cards:]
+    del deck[-num_cards:]
+    drawn.reverse()
+    return [drawn[i:i + 2] for i in range(0, num_cards, 2)]
 
 def init_players(num_players=NUM_PLAYERS, stack=STARTING_STACK):
     """Initializes player objects with starting stacks and active status."""
     return [
-        {"name": f"Player {i+1}", "hand": [], "stack": stack, "current_bet": 0, "status": "active"}
+        {"name": f"Player {i+1}", "hand": [], "stack": stack, "current_bet": 0, "status": ACTIVE}
         for i in range(num_players)
     ]
 
-def start_new_game():
-    """Initializes a complete new poker game with deck, players, blinds, and hand history."""
-    import os
-    from datetime import datetime
-    deck = create_deck()
-    random.shuffle(deck)
+def _new_opponent_model():
+    """Empty opponent stats, built only when a game doesn't have them yet."""
+    return {
+        'hands_played': 0,
+        'preflop_stats': {
+            'vpip': 0, 'pfr': 0, 'three_bet': 0,
+            'vpip_opportunities': 0, 'pfr_opportunities': 0, 'three_bet_opportunities': 0
+        },
+        'postflop_stats': {
+            'cbet': 0, 'cbet_opportunities': 0,
+            'fold_to_cbet': 0, 'fold_to_cbet_opportunities': 0
+        }
+    }
+
+def start_new_game(hand_history=True):
+    """Initializes a complete new poker game with deck, players, blinds, and hand history.
+
+    Pass hand_history=False to skip creating the session's hand history file.
+    """
+    deck = _reshuffle_deck([])
     players = init_players()
     hands = deal_cards(deck, NUM_PLAYERS)
     for i, hand in enumerate(hands):
         players[i]['hand'] = hand
 
-    dealer_pos = random.randint(0, NUM_PLAYERS - 1)  # Random starting dealer
+    dealer_pos = _rng.randrange(NUM_PLAYERS)  # Random starting dealer
 
     # Create a unique hand history file for this game session
     # Try to create hand history directory and file (may fail in read-only environments)
     hand_history_path = None
-    try:
-        hand_history_dir = os.path.join(os.path.dirname(__file__), '../hand_history')
-        os.makedirs(hand_history_dir, exist_ok=True)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        hand_history_filename = f"game_session_{timestamp}.txt"
-        hand_history_path = os.path.join(hand_history_dir, hand_history_filename)
+    if hand_history:
+        try:
+            hand_history_dir = os.path.join(os.path.dirname(__file__), '../hand_history')
+            os.makedirs(hand_history_dir, exist_ok=True)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            hand_history_filename = f"game_session_{timestamp}.txt"
+            hand_history_path = os.path.join(hand_history_dir, hand_history_filename)
         
-        # Create the file (clears previous content if it exists)
-        with open(hand_history_path, 'w') as f:
-            pass  # Just to create the file
-    except (OSError, PermissionError) as e:
-        print(f"Warning: Could not create hand history file: {e}")
-        hand_history_path = None
+            # Create the file (clears previous content if it exists)
+            with open(hand_history_path, 'w') as f:
+                pass  # Just to create the file
+        except (OSError, PermissionError) as e:
+            print(f"Warning: Could not create hand history file: {e}")
+            hand_history_path = None
 
     game_state = {
         "players": players,
@@ -79,264 +119,280 @@ def start_new_game():
         "current_bet": 0,
         "last_bet_amount": 0,
         "action_history": [],
+        "actions_this_round_mask": 0,
+        "last_aggressor_idx": -1,
         "hand_history_path": hand_history_path,
+        "hand_history_buffer": [],  # Lines of the current hand, one file append per hand
         "hand_count": 1,  # Start with hand #1
         "big_blind": BIG_BLIND,
-        "opponent_model": {
-            'hands_played': 0,
-            'preflop_stats': {
-                'vpip': 0, 'pfr': 0, 'three_bet': 0,
-                'vpip_opportunities': 0, 'pfr_opportunities': 0, 'three_bet_opportunities': 0
-            },
-            'postflop_stats': {
-                'cbet': 0, 'cbet_opportunities': 0,
-                'fold_to_cbet': 0, 'fold_to_cbet_opportunities': 0
-            }
-        }
+        "opponent_model": _new_opponent_model()
     }
     
     # Log the header for the first hand
     log_hand_start_header(game_state)
     
+    _count_statuses(game_state)
     apply_antes(game_state)
     post_blinds(game_state)
     return game_state
 
-def apply_antes(game_state):
+def _apply_antes(game_state):
     """Collects ante from all active players before dealing cards."""
-    if ANTE > 0:
-        for player in game_state['players']:
-            if player['status'] == "active" and player['stack'] >= ANTE:
-                player['stack'] -= ANTE
-                game_state['pot'] += ANTE
-            if player['stack'] == 0:
-                player['status'] = 'out'
-
-def deal_community_cards(game_state):
-    """Deals community cards for next street (flop: 3 cards, turn/river: 1 card each)."""
-    # progress the game to the next betting round
-    deck = game_state['deck']
-    community = game_state['community']
-    round = game_state['betting_round']
-
-    if round == "preflop":
-        community.extend([deck.pop() for _ in range(3)])
-        game_state['betting_round'] = "flop"
-    elif round == "flop":
-        community.append(deck.pop())
-        game_state['betting_round'] = "turn"
-    elif round == "turn":
-        community.append(deck.pop())
-        game_state['betting_round'] = "river"
-    # no cards on river (after river go to showdown)
-    return game_state
+    for player in game_state['players']:
+        if player['status'] == ACTIVE and player['stack'] >= ANTE:
+            player['stack'] -= ANTE
+            game_state['pot'] += ANTE
+        if player['stack'] == 0:
+            player['status'] = OUT
+    # Antes can put players out, so the counts have to be redone
+    _count_statuses(game_state)
+
+def _no_antes(game_state):
+    """Antes are off in config, nothing to collect."""
 
-def next_player(game_state):
+# ANTE is fixed by config like the table size, so pick the ante step once
+apply_antes = _apply_antes if ANTE > 0 else _no_antes
+
+def _count_statuses(game_state):
+    """Recounts players still in the hand and players still able to act, apply_action keeps these current."""
+    in_hand = active = 0
+    for player in game_state['players']:
+        status = player['status']
+        if status == ACTIVE:
+            active += 1
+            in_hand += 1
+        elif status == ALL_IN:
+            in_hand += 1
+    game_state['in_hand_count'] = in_hand
+    game_state['active_count'] = active
+
+# Cards dealt when leaving each street, the street that comes next and its history header
+_BOARD_PROGRESSION = {
+    'preflop': (3, 'flop', "\n*** FLOP ***"),
+    'flop': (1, 'turn', "\n*** TURN ***"),
+    'turn': (1, 'river', "\n*** RIVER ***"),
+    'river': (0, 'showdown', "\n*** SHOW DOWN ***"),
+}
+
+def _deal_board(game_state, num_cards):
+    """Moves num_cards from the top of the deck onto the board."""
+    if num_cards:
+        deck = game_state['deck']
+        # One slice and one truncate instead of a pop per card, reversed to keep pop order
+        drawn = deck[-num_cards:]
+        del deck[-num_cards:]
+        drawn.reverse()
+        game_state['community'].extend(drawn)
+
+def _next_player_hu(game_state):
+    """Heads-up turn order: the other seat acts next if it is still active."""
+    other = game_state['current_player'] ^ 1
+    if game_state['players'][other]['status'] == ACTIVE:
+        game_state['current_player'] = other
+
+def _next_player_generic(game_state):
     """Advances to the next active player in turn order."""
-    num_players = len(game_state['players'])
+    players = game_state['players']
+    num_players = len(players)
     i = game_state['current_player']
-    print(f"DEBUG: next_player called, current: {i}")
     for _ in range(num_players):
         i = (i + 1) % num_players
-        print(f"DEBUG: checking player {i}, status: {game_state['players'][i]['status']}")
-        if game_state['players'][i]['status'] == "active":
+        if players[i]['status'] == ACTIVE:
             game_state['current_player'] = i
-            print(f"DEBUG: next_player set current_player to {i}")
             return
-    print(f"DEBUG: next_player found no active players!")
+
+# Table size is fixed by config, so pick the turn-order routine once at import
+next_player = _next_player_hu if NUM_PLAYERS == 2 else _next_player_generic
+
+# Seat tables indexed by button seat, built once instead of doing modulo math every hand
+# Heads-up the button posts the small blind and acts first preflop
+if NUM_PLAYERS == 2:
+    _NEXT_BUTTON = (1, 0)
+    _BLIND_SEATS = ((0, 1, 0), (1, 0, 1))  # (small blind, big blind, first to act)
+else:
+    _NEXT_BUTTON = tuple((d + 1) % NUM_PLAYERS for d in range(NUM_PLAYERS))
+    _BLIND_SEATS = tuple(
+        ((d + 1) % NUM_PLAYERS, (d + 2) % NUM_PLAYERS, (d + 3) % NUM_PLAYERS)
+        for d in range(NUM_PLAYERS)
+    )
 
 def log_to_hand_history(game_state, message):
-    """Appends a message to the hand history file for game analysis and replay."""
+    """Queues a message for the hand history file, written out by flush_hand_history."""
+    if game_state.get('hand_history_path'):
+        game_state['hand_history_buffer'].append(message)
+
+def flush_hand_history(game_state):
+    """Appends the buffered hand history lines to the file in one write."""
+    buffer = game_state.get('hand_history_buffer')
+    if not buffer:
+        return
     if game_state.get('hand_history_path'):
         try:
             with open(game_state['hand_history_path'], 'a') as f:
-                f.write(message + '\n')
+                f.write('\n'.join(buffer) + '\n')
         except (OSError, PermissionError):
             # Silently skip logging if file operations fail
             pass
+    buffer.clear()
+
+def _commit_chips(game_state, player, chips):
+    """Moves chips from a player's stack into the pot, returns True if that put them all-in."""
+    stack = player['stack'] - chips
+    player['stack'] = stack
+    player['current_bet'] += chips
+    game_state['pot'] += chips
+    if stack == 0:
+        player['status'] = ALL_IN
+        return True
+    return False
+
+def to_chips(amount):
+    """Rounds a bet size to whole chips, halves up, for AI sizing that works in floats."""
+    return math.floor(amount + 0.5)
 
 def apply_action(game_state, action, amount=0):
-    """Processes player actions (fold/call/raise/check/bet) and updates game state accordingly."""
-    player = game_state['players'][game_state['current_player']]
-    to_call = game_state.get('current_bet', 0) - player['current_bet']
-    log_message = ""
-    round_name = game_state.get('betting_round', 'preflop')
-    # Ensure action_history exists
-    if 'action_history' not in game_state:
-        game_state['action_history'] = []
+    """Processes player actions (fold/call/raise/check/bet) and updates game state accordingly.
+
+    amount is in whole chips, run AI sizing through to_chips first.
+    """
+    player_idx = game_state['current_player']
+    player = game_state['players'][player_idx]
+    prev_status = player['status']
+    name = player['name']
+    stack = player['stack']
+    player_bet = player['current_bet']
+    previous_bet = game_state['current_bet']
+    to_call = previous_bet - player_bet
+    round_name = game_state['betting_round']
+    action_history = game_state['action_history']
 
     if action == 'fold':
-        player['status'] = 'folded'
-        log_message = f"{player['name']}: folds"
+        player['status'] = FOLDED
+        log_message = f"{name}: folds"
         # Record action
-        game_state['action_history'].append({'player': player['name'], 'action': 'fold', 'amount': 0, 'round': round_name})
+        action_history.append({'player': name, 'action': 'fold', 'amount': 0, 'round': round_name})
     elif action == 'call':
-        call_amt = min(to_call, player['stack'])
-        player['stack'] -= call_amt
-        player['current_bet'] += call_amt
-        game_state['pot'] += call_amt
-        log_message = f"{player['name']}: calls ${call_amt:.0f}"
-        if player['stack'] == 0:
-            player['status'] = 'all-in'
+        call_amt = to_call if to_call < stack else stack
+        log_message = f"{name}: calls ${call_amt}"
+        if _commit_chips(game_state, player, call_amt):
             log_message += " and is all-in"
         # Record action
-        game_state['action_history'].append({'player': player['name'], 'action': 'call', 'amount': call_amt, 'round': round_name})
+        action_history.append({'player': name, 'action': 'call', 'amount': call_amt, 'round': round_name})
     elif action == 'raise':
         # amount is the total bet amount
-        total_bet = amount
-        raise_amount = total_bet - to_call - player['current_bet'] # The actual amount of the raise
-        additional_bet = total_bet - player['current_bet']
-        
+        raise_amount = amount - to_call - player_bet # The actual amount of the raise
         # Clamp to stack size
-        additional_bet = min(additional_bet, player['stack'])
-        total_bet = player['current_bet'] + additional_bet
+        additional_bet = amount - player_bet
+        if additional_bet > stack:
+            additional_bet = stack
+        total_bet = player_bet + additional_bet
 
-        player['stack'] -= additional_bet
-        player['current_bet'] += additional_bet
-        game_state['pot'] += additional_bet
-        
-        log_message = f"{player['name']}: raises ${raise_amount:.0f} to ${total_bet:.0f}"
-        
-        # Update last bet amount
-        previous_bet = game_state.get('current_bet', 0)
-        game_state['current_bet'] = player['current_bet']
-        game_state['last_bet_amount'] = player['current_bet'] - previous_bet
-        
-        if player['stack'] == 0:
-            player['status'] = 'all-in'
+        log_message = f"{name}: raises ${raise_amount} to ${total_bet}"
+        if _commit_chips(game_state, player, additional_bet):
             log_message += " and is all-in"
+
+        # Update last bet amount
+        game_state['current_bet'] = total_bet
+        game_state['last_bet_amount'] = total_bet - previous_bet
         # Record action as 'raise' with total target
-        game_state['action_history'].append({'player': player['name'], 'action': 'raise', 'amount': total_bet, 'round': round_name})
+        action_history.append({'player': name, 'action': 'raise', 'amount': total_bet, 'round': round_name})
     elif action == 'check':
         if to_call != 0:
             raise ValueError("Cannot check when facing a bet")
-        log_message = f"{player['name']}: checks"
+        log_message = f"{name}: checks"
         # Record action
-        game_state['action_history'].append({'player': player['name'], 'action': 'check', 'amount': 0, 'round': round_name})
+        action_history.append({'player': name, 'action': 'check', 'amount': 0, 'round': round_name})
     elif action == 'bet':
         # This action is for when the first action in a post-flop round is a bet
-        bet_amount = min(amount, player['stack'])
-        player['stack'] -= bet_amount
-        player['current_bet'] += bet_amount
-        game_state['pot'] += bet_amount
+        bet_amount = amount if amount < stack else stack
+        log_message = f"{name}: bets ${bet_amount}"
+        if _commit_chips(game_state, player, bet_amount):
+            log_message += " and is all-in"
         game_state['current_bet'] = bet_amount
         game_state['last_bet_amount'] = bet_amount
-        log_message = f"{player['name']}: bets ${bet_amount:.0f}"
-        if player['stack'] == 0:
-            player['status'] = 'all-in'
-            log_message += " and is all-in"
         # Record action
-        game_state['action_history'].append({'player': player['name'], 'action': 'bet', 'amount': bet_amount, 'round': round_name})
+        action_history.append({'player': name, 'action': 'bet', 'amount': bet_amount, 'round': round_name})
     else:
         raise ValueError("Invalid action")
 
+    # Per-round bookkeeping so betting_round_over doesn't have to rescan action_history
+    game_state['actions_this_round_mask'] = game_state['actions_this_round_mask'] | (1 << player_idx)
+    game_state['last_aggressor_idx'] = player_idx if action in ('raise', 'bet') else -1
+    status = player['status']
+    if status != prev_status:
+        game_state['active_count'] += (status == ACTIVE) - (prev_status == ACTIVE)
+        game_state['in_hand_count'] += (status in IN_HAND) - (prev_status in IN_HAND)
+
     if log_message:
         log_to_hand_history(game_state, log_message)
 
     # Move to next player (handled outside in your round controller)
 
-def betting_round_over(game_state):
-    """Determines if the current betting round is complete based on player actions and bet matching."""
-    # Include both active and all-in players in the count
-    players_in_hand = [p for p in game_state['players'] if p['status'] in ['active', 'all-in']]
-    active_players = [p for p in game_state['players'] if p['status'] == 'active']
-    
+def _betting_round_over_hu(game_state):
+    """Heads-up round check using the acted mask and last aggressor kept by apply_action."""
+    p0, p1 = game_state['players']
+    s0, s1 = p0['status'], p1['status']
+    active0, active1 = s0 == ACTIVE, s1 == ACTIVE
+
+    # Someone folded (or is out), or both players are all-in
+    if s0 not in IN_HAND or s1 not in IN_HAND:
+        return True
+    if not (active0 or active1):
+        return True
+
+    current_bet = game_state['current_bet']
+    matched0 = p0['current_bet'] == current_bet
+    matched1 = p1['current_bet'] == current_bet
+
+    # One player is all-in and the other has matched the bet
+    if not (active0 and active1) and (matched0 if active0 else matched1):
+        return True
+
+    # Anyone who can still put chips in must match the bet
+    if active0 and not matched0 and p0['stack'] > 0:
+        return False
+    if active1 and not matched1 and p1['stack'] > 0:
+        return False
+
+    # Every active player must have acted this round
+    acted = game_state['actions_this_round_mask']
+    if acted == 0 or (active0 and not acted & 1) or (active1 and not acted & 2):
+        return False
+
+    # A raise/bet still waiting on an answer from the other player
+    aggressor = game_state['last_aggressor_idx']
+    return aggressor < 0 or not (active1 if aggressor == 0 else active0)
+
+def _betting_round_over_generic(game_state):
+    """Multi-way round check using the status counts and acted mask kept by apply_action."""
     # If only one player total is left in the hand, round is over
-    if len(players_in_hand) <= 1:
+    if game_state['in_hand_count'] <= 1:
         return True
-    
     # If all remaining players are all-in, no more betting can occur
-    if len(active_players) == 0:
+    active = game_state['active_count']
+    if active == 0:
         return True
 
-    # Check if no more betting actions are possible
-    # This happens when at least one player is all-in and all others have called
-    all_in_players = [p for p in game_state['players'] if p['status'] == 'all-in']
-    if len(all_in_players) > 0:
-        # If someone is all-in, check if all other players have matched the current bet
-        current_bet = game_state.get('current_bet', 0)
-        all_matched = True
-        for player in players_in_hand:
-            if player['status'] == 'active' and player['current_bet'] != current_bet:
-                all_matched = False
-                break
-        if all_matched:
-            return True
-
-    # All active players must have matched the current bet
-    current_bet = game_state.get('current_bet', 0)
-    
-    # Check if anyone still needs to call (only active players can act)
-    for player in active_players:
-        if player['stack'] > 0 and player['current_bet'] != current_bet:
-            return False
-    
-    # Now check if betting action is complete
-    action_history = game_state.get('action_history', [])
-    betting_round = game_state.get('betting_round', 'preflop')
-    round_actions = [a for a in action_history if a.get('round') == betting_round]
-    
-    # If there are no actions this round, betting isn't over
-    if len(round_actions) == 0:
+    current_bet = game_state['current_bet']
+    all_matched = True   # every active player has matched the current bet
+    owes_chips = False   # an active player with chips left still has to call
+    for player in game_state['players']:
+        if player['status'] == ACTIVE and player['current_bet'] != current_bet:
+            all_matched = False
+            if player['stack'] > 0:
+                owes_chips = True
+
+    # Someone is all-in and everyone else has matched the bet
+    if game_state['in_hand_count'] > active and all_matched:
+        return True
+    # Anyone who can still put chips in must match the bet
+    if owes_chips:
         return False
-    
-    # For heads-up poker, we need special logic
-    if len(game_state['players']) == 2:
-        # Get the current player index and the other player
-        current_player_idx = game_state.get('current_player', 0)
-        other_player_idx = 1 - current_player_idx
-        
-        current_player = game_state['players'][current_player_idx]
-        other_player = game_state['players'][other_player_idx]
-        
-        # If current player has already acted this round, and all bets are matched, round is over
-        # Exception: if other player just raised and current player hasn't responded
-        
-        current_player_actions = [a for a in round_actions if a.get('player') == current_player['name']]
-        other_player_actions = [a for a in round_actions if a.get('player') == other_player['name']]
-        
-        # Both players must have acted at least once (unless one folded/all-in)
-        if current_player['status'] == 'active' and len(current_player_actions) == 0:
-            return False
-        if other_player['status'] == 'active' and len(other_player_actions) == 0:
-            return False
-        
-        # Check if the last action was a raise/bet and the other player needs to respond
-        if len(round_actions) > 0:
-            last_action = round_actions[-1]
-            last_actor_name = last_action.get('player', '')
-            
-            # If last action was a raise/bet and the other player hasn't responded yet
-            if last_action['action'] in ['raise', 'bet']:
-                # Find who needs to respond
-                responder = None
-                for p in [current_player, other_player]:
-                    if p['name'] != last_actor_name and p['status'] == 'active':
-                        responder = p
-                        break
-                
-                # If there's someone who needs to respond and they haven't acted after the raise
-                if responder:
-                    # Check if responder acted after this raise by looking at subsequent actions
-                    last_raise_index = -1
-                    for i in range(len(round_actions) - 1, -1, -1):
-                        if (round_actions[i].get('player') == last_actor_name and 
-                            round_actions[i]['action'] in ['raise', 'bet']):
-                            last_raise_index = i
-                            break
-                    
-                    # If we found the raise, check if responder acted after it
-                    if last_raise_index >= 0:
-                        responder_acted_after = False
-                        for i in range(last_raise_index + 1, len(round_actions)):
-                            if round_actions[i].get('player') == responder['name']:
-                                responder_acted_after = True
-                                break
-                        
-                        if not responder_acted_after:
-                            return False
-    
-    return True
+    # If there are no actions this round, betting isn't over
+    return game_state['actions_this_round_mask'] != 0
+
+# Same as next_player, the table size can't change mid-game so pick the round check once
+betting_round_over = _betting_round_over_hu if NUM_PLAYERS == 2 else _betting_round_over_generic
 
 def run_betting_round(game_state, action_sequence):
     """Executes a sequence of betting actions for automated testing and simulation."""
@@ -345,7 +401,7 @@ def run_betting_round(game_state, action_sequence):
         if betting_round_over(game_state):
             break
         next_player(game_state)
-    reset_bets(game_state)  # When moving to next street
+    # Bets are left in place, advance_round resets them when moving to the next street
 
 
 # Note: determine_winner function removed as it's redundant with showdown()
@@ -355,58 +411,35 @@ def reset_bets(game_state):
     for player in game_state['players']:
         player['current_bet'] = 0
         # Reset player status to active if they have chips and aren't folded
-        if player['stack'] > 0 and player['status'] not in ['folded']:
-            player['status'] = 'active'
+        if player['stack'] > 0 and player['status'] != FOLDED:
+            player['status'] = ACTIVE
     game_state['current_bet'] = 0
     game_state['last_bet_amount'] = 0  # Reset last bet amount for new round
-    # Keep action_history but ensure it's initialized
-    if 'action_history' not in game_state:
-        game_state['action_history'] = []
+    game_state['actions_this_round_mask'] = 0
+    game_state['last_aggressor_idx'] = -1
+    _count_statuses(game_state)
 
 def advance_round(game_state):
     """Progresses to next street: flop, turn, river, or showdown with community cards."""
-    round = game_state['betting_round']
-    if round == 'preflop':
-        flop = [game_state['deck'].pop() for _ in range(3)]
-        game_state['community'].extend(flop)
-        game_state['betting_round'] = 'flop'
-        flop_str = " ".join(f"{c}" for c in flop)
-        log_to_hand_history(game_state, f"\n*** FLOP *** [{flop_str}]")
-    elif round == 'flop':
-        turn = game_state['deck'].pop()
-        game_state['community'].append(turn)
-        game_state['betting_round'] = 'turn'
-        turn_str = " ".join(f"{c}" for c in game_state['community'])
-        log_to_hand_history(game_state, f"\n*** TURN *** [{turn_str}]")
-    elif round == 'turn':
-        river = game_state['deck'].pop()
-        game_state['community'].append(river)
-        game_state['betting_round'] = 'river'
-        river_str = " ".join(f"{c}" for c in game_state['community'])
-        log_to_hand_history(game_state, f"\n*** RIVER *** [{river_str}]")
-    elif round == 'river':
-        game_state['betting_round'] = 'showdown'
-        log_to_hand_history(game_state, "\n*** SHOW DOWN ***")
+    progression = _BOARD_PROGRESSION.get(game_state['betting_round'])
+    if progression:
+        num_cards, next_round, header = progression
+        game_state['betting_round'] = next_round
+        if num_cards:
+            _deal_board(game_state, num_cards)
+            community = game_state['community']
+            if num_cards == 3:
+                log_to_hand_history(game_state, f"{header} [{' '.join(community)}]")
+            else:
+                # Turn and river show the old board, then the new card on its own like PokerStars
+                log_to_hand_history(game_state, f"{header} [{' '.join(community[:-1])}] [{community[-1]}]")
+        else:
+            log_to_hand_history(game_state, header)
     reset_bets(game_state)
 
 def deal_remaining_cards(game_state):
     """Deals all remaining community cards when all players are all-in (run-out)."""
-    round = game_state['betting_round']
-    
-    if round == 'preflop':
-        # Deal flop (3 cards)
-        game_state['community'].extend([game_state['deck'].pop() for _ in range(3)])
-        # Deal turn (1 card)
-        game_state['community'].append(game_state['deck'].pop())
-        # Deal river (1 card)
-        game_state['community'].append(game_state['deck'].pop())
-    elif round == 'flop':
-        # Deal turn and river
-        game_state['community'].append(game_state['deck'].pop())
-        game_state['community'].append(game_state['deck'].pop())
-    elif round == 'turn':
-        # Deal river only
-        game_state['community'].append(game_state['deck'].pop())
+    _deal_board(game_state, 5 - len(game_state['community']))
     
     # Set to showdown
     game_state['betting_round'] = 'showdown'
@@ -415,66 +448,59 @@ def deal_remaining_cards(game_state):
 
 def log_hand_start_header(game_state):
     """Logs the PokerStars-style header with hand number, stakes, and player positions."""
-    from datetime import datetime
-    hand_history_path = game_state['hand_history_path']
     hand_count = game_state['hand_count']
     dealer_pos = game_state['dealer_pos']
     players = game_state['players']
     
-    try:
-        with open(hand_history_path, 'a') as f:
-            if hand_count > 1:
-                f.write("\n\n") # Add spacing for subsequent hands
-                
-            f.write(f"Riposte Hand #{hand_count:05d}:  Hold'em No Limit (${SMALL_BLIND}/${BIG_BLIND}) - {datetime.now().strftime('%Y/%m/%d %H:%M:%S ET')}\n")
-            f.write(f"Table 'Heads-Up' 2-max Seat #{dealer_pos + 1} is the button\n")
-            for i, p in enumerate(players):
-                role = " (button)" if i == dealer_pos else ""
-                f.write(f"Seat {i+1}: {p['name']}{role} (${p['stack']:.0f} in chips)\n")
-    except Exception as e:
-        print(f"Warning: Could not write hand history header: {e}")
-        # Continue without hand history logging
-        return
+    spacing = "\n\n" if hand_count > 1 else ""  # Add spacing for subsequent hands
+    log_to_hand_history(game_state, f"{spacing}Riposte Hand #{hand_count:05d}:  Hold'em No Limit (${SMALL_BLIND}/${BIG_BLIND}) - {datetime.now().strftime('%Y/%m/%d %H:%M:%S ET')}")
+    log_to_hand_history(game_state, f"Table 'Heads-Up' 2-max Seat #{dealer_pos + 1} is the button")
+    for i, p in enumerate(players):
+        role = " (button)" if i == dealer_pos else ""
+        log_to_hand_history(game_state, f"Seat {i+1}: {p['name']}{role} (${p['stack']} in chips)")
 
 
 def prepare_next_hand(game_state):
     """Sets up the next hand with new cards, rotated dealer, and preserved opponent stats."""
+    # Write out anything left over from a hand that never reached showdown
+    flush_hand_history(game_state)
+
     # Preserve opponent model across hands and increment hand counter
-    opponent_model = game_state.get('opponent_model', {
-        'hands_played': 0,
-        'preflop_stats': {'vpip': 0, 'pfr': 0, 'three_bet': 0, 'vpip_opportunities': 0, 'pfr_opportunities': 0, 'three_bet_opportunities': 0},
-        'postflop_stats': {'cbet': 0, 'cbet_opportunities': 0, 'fold_to_cbet': 0, 'fold_to_cbet_opportunities': 0}
-    })
+    opponent_model = game_state.get('opponent_model')
+    if opponent_model is None:
+        opponent_model = _new_opponent_model()
     opponent_model['hands_played'] += 1
     game_state['hand_count'] += 1
 
-    num_players = len(game_state['players'])
-    dealer_pos = (game_state['dealer_pos'] + 1) % num_players
-    deck = create_deck()
-    random.shuffle(deck)
-    hands = deal_cards(deck, num_players)
+    dealer_pos = _NEXT_BUTTON[game_state['dealer_pos']]
+    # The deck list is refilled in place, hole cards go straight to the players
+    deck = _reshuffle_deck(game_state['deck'])
     players = game_state['players']
 
-    for i, player in enumerate(players):
-        player['hand'] = hands[i]
+    # Statuses are reset here, so count the players in the hand in the same pass
+    in_hand = 0
+    for player, hand in zip(players, deal_cards(deck, len(players))):
+        player['hand'] = hand
         player['current_bet'] = 0
         if player['stack'] > 0:
-            player['status'] = "active"
+            player['status'] = ACTIVE
+            in_hand += 1
         else:
-            player['status'] = "out"
-            
-    game_state.update({
-        "deck": deck,
-        "community": [],
-        "pot": 0,
-        "dealer_pos": dealer_pos,
-        "betting_round": 'preflop',
-        "current_bet": 0,
-        "last_bet_amount": 0,
-        "action_history": [],
-        "opponent_model": opponent_model,
-        "current_player": dealer_pos
-    })
+            player['status'] = OUT
+
+    # community and action_history get fresh lists since the last hand's ones may still be referenced
+    game_state['community'] = []
+    game_state['action_history'] = []
+    game_state['pot'] = 0
+    game_state['dealer_pos'] = dealer_pos
+    game_state['current_player'] = dealer_pos
+    game_state['betting_round'] = 'preflop'
+    game_state['current_bet'] = 0
+    game_state['last_bet_amount'] = 0
+    game_state['actions_this_round_mask'] = 0
+    game_state['last_aggressor_idx'] = -1
+    game_state['opponent_model'] = opponent_model
+    game_state['in_hand_count'] = game_state['active_count'] = in_hand
     
     # Log the header for the new hand
     log_hand_start_header(game_state)
@@ -484,112 +510,83 @@ def prepare_next_hand(game_state):
 
 
 
-def distribute_side_pots(players_in_hand, player_scores, game_state):
-    """Calculates and distributes side pots for all-in scenarios with unequal investments."""
-    winnings = {p['name']: 0 for p in game_state['players']}
-    
-    # Get investment amounts (current_bet) for each player in hand
-    investments = {}
-    for player in players_in_hand:
-        investments[player['name']] = player['current_bet']
-    
-    print(f"DEBUG: Player investments: {investments}")
-    print(f"DEBUG: Total pot: {game_state['pot']}")
-    
-    # Simple case: if all players invested the same amount, distribute normally
-    investment_amounts = list(investments.values())
-    if len(set(investment_amounts)) == 1:
-        # All players invested the same - simple distribution
-        total_pot = game_state['pot']
-        # Determine winners among all players in hand
-        # player_scores: name -> (score, hand_class, player)
-        best_score = min(player_scores[name][0] for name in investments.keys())
-        winners = [player_scores[name][2] for name in investments.keys() if player_scores[name][0] == best_score]
-        pot_share = total_pot / len(winners)
-        
-        for winner_player in winners:
-            winnings[winner_player['name']] = pot_share
-            winner_player['stack'] += pot_share
-        
-        print(f"DEBUG: Equal investments - simple distribution: {winnings}")
-        return winnings
-    
-    # Complex case: different investment amounts - create side pots
-    # Sort by investment amount (lowest to highest)
-    sorted_investments = sorted(investments.items(), key=lambda x: x[1])
-    
-    # Create side pots based on investment levels
-    side_pots = []
+def _compute_side_pots(investments, scores, seat_order, dead_money=0):
+    """
+    Numeric core of side pot distribution, kept free of player dicts.
+
+    Args:
+        investments (list): chips each player in the hand put in
+        scores (list): hand score per player (lower is better)
+        seat_order (list): seat distance left of the button per player, for odd chips
+        dead_money (int): chips already in the pot from earlier streets or folded players,
+            everyone in the hand is eligible for these so they go in the main pot
+
+    Returns:
+        list: size of each pot, from the main pot up
+        list: chips won per player
+    """
+    num = len(investments)
+    winnings = [0] * num
+    pot_sizes = []
     prev_level = 0
-    
-    for i, (current_player, investment) in enumerate(sorted_investments):
-        if investment > prev_level:
-            # Calculate how many players contributed to this level
-            # Everyone who invested at least this much
-            contributors = [name for name, amt in investments.items() if amt >= investment]
-            num_contributors = len(contributors)
-            
-            # Size of this side pot: (level_difference) * (number_of_contributors)
-            level_diff = investment - prev_level
-            pot_size = level_diff * num_contributors
-            
-            # Players eligible for this side pot are those who invested at least this much
-            eligible_players = contributors.copy()
-            
-            side_pots.append({
-                'size': pot_size,
-                'eligible_players': eligible_players,
-                'level': investment,
-                'prev_level': prev_level,
-                'contributors': contributors
-            })
-            
-            prev_level = investment
-    
-    print(f"DEBUG: Side pots created: {side_pots}")
-    
-    # Distribute each side pot to the best eligible hand(s)
-    for pot in side_pots:
-        print(f"DEBUG: Processing side pot of ${pot['size']:.0f} for players: {pot['eligible_players']}")
-        
-        # Find the best hand among eligible players using full player_scores
-        eligible_names = [name for name in pot['eligible_players'] if name in player_scores]
-        if not eligible_names:
-            continue
-        best_score = min(player_scores[name][0] for name in eligible_names)
-        eligible_winners = [player_scores[name] for name in eligible_names if player_scores[name][0] == best_score]
-        
-        if eligible_winners:
-            # Split this side pot among eligible winners with the best hand
-            pot_share = pot['size'] / len(eligible_winners)
-            for _, _, winner_player in eligible_winners:
-                winnings[winner_player['name']] += pot_share
-                winner_player['stack'] += pot_share
-                print(f"DEBUG: Awarded ${pot_share:.0f} from side pot to {winner_player['name']}")
-    
-    print(f"DEBUG: Final winnings distribution: {winnings}")
-    
-    # Verify total distributed equals total pot
-    total_distributed = sum(winnings.values())
-    print(f"DEBUG: Total distributed: ${total_distributed:.0f}, Total pot: ${game_state['pot']:.0f}")
-    
+    # Each distinct investment level closes a pot that everyone at or above it contributed to
+    for level in sorted(set(investments)):
+        eligible = [i for i in range(num) if investments[i] >= level]
+        pot_size = (level - prev_level) * len(eligible) + dead_money
+        prev_level = level
+        dead_money = 0
+        pot_sizes.append(pot_size)
+
+        best_score = min(scores[i] for i in eligible)
+        pot_winners = sorted((i for i in eligible if scores[i] == best_score), key=seat_order.__getitem__)
+        share, odd_chips = divmod(pot_size, len(pot_winners))
+        for k, i in enumerate(pot_winners):
+            winnings[i] += share + 1 if k < odd_chips else share
+    return pot_sizes, winnings
+
+def distribute_side_pots(players_in_hand, player_scores, game_state):
+    """Distributes the pot as a main pot plus a side pot per extra all-in investment level."""
+    players = game_state['players']
+    num_players = len(players)
+    dealer_pos = game_state['dealer_pos']
+    winnings = {p['name']: 0 for p in players}
+
+    # Investment this street (current_bet) per player in hand, the rest of the pot is dead money
+    names = [p['name'] for p in players_in_hand]
+    investments = [p['current_bet'] for p in players_in_hand]
+    scores = [player_scores[name][0] for name in names]
+    # Seat distance left of the button, used to hand out odd chips
+    seat_order = [(players.index(p) - dealer_pos - 1) % num_players for p in players_in_hand]
+    dead_money = game_state['pot'] - sum(investments)
+
+    pot_sizes, won = _compute_side_pots(investments, scores, seat_order, dead_money)
+    if DEBUG:
+        print(f"DEBUG: Player investments: {dict(zip(names, investments))}")
+        print(f"DEBUG: Total pot: {game_state['pot']}")
+        print(f"DEBUG: Pots created: {pot_sizes}")
+
+    for player, amount in zip(players_in_hand, won):
+        if amount:
+            winnings[player['name']] += amount
+            player['stack'] += amount
+
+    if DEBUG:
+        print(f"DEBUG: Final winnings distribution: {winnings}")
     return winnings
 
 def showdown(game_state):
     """Evaluates all hands, determines winners, distributes pots, and logs complete results."""
     community = game_state['community']
-    players_in_hand = [p for p in game_state['players'] if p['status'] in ['active', 'all-in']]
+    players_in_hand = [p for p in game_state['players'] if p['status'] in IN_HAND]
     all_players = game_state['players']
     winners = []
     player_scores = {}
     
-    # Store initial state for summary
-    initial_stacks = {p['name']: p['stack'] + p['current_bet'] for p in all_players}
-    
-    print(f"DEBUG SHOWDOWN: Initial state:")
-    for p in all_players:
-        print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}, total={p['stack'] + p['current_bet']}")
-    print(f"DEBUG SHOWDOWN: Total pot = {game_state['pot']}")
+    if DEBUG:
+        print(f"DEBUG SHOWDOWN: Initial state:")
+        for p in all_players:
+            print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}, total={p['stack'] + p['current_bet']}")
+        print(f"DEBUG SHOWDOWN: Total pot = {game_state['pot']}")
     
     # --- Single Winner by Folds ---
     if len(players_in_hand) == 1:
@@ -600,67 +597,65 @@ def showdown(game_state):
         uncalled_bet = pot_won - sum(p['current_bet'] for p in all_players if p != winner)
         if uncalled_bet > 0:
             winner['stack'] += uncalled_bet
-            log_to_hand_history(game_state, f"Uncalled bet (${uncalled_bet:.0f}) returned to {winner['name']}")
+            log_to_hand_history(game_state, f"Uncalled bet (${uncalled_bet}) returned to {winner['name']}")
 
         winnings = pot_won - uncalled_bet
         winner['stack'] += winnings
-        log_to_hand_history(game_state, f"{winner['name']} collected ${winnings:.0f} from pot")
+        log_to_hand_history(game_state, f"{winner['name']} collected ${winnings} from pot")
         log_to_hand_history(game_state, f"{winner['name']}: doesn't show hand")
         winners = [{'name': winner['name'], 'hand': winner['hand'], 'hand_class': 'by fold'}]
+        collected = {winner['name']: pot_won}
         
     # --- Showdown with 2+ Players ---
     else:
-        for player in players_in_hand:
-            score, hand_class = evaluate_hand(player['hand'], community)
+        # Board is shared by everyone at showdown, evaluate all hands against it in one go
+        results = evaluate_hands([player['hand'] for player in players_in_hand], community)
+        for player, (score, hand_class) in zip(players_in_hand, results):
             player_scores[player['name']] = (score, hand_class, player)
             log_to_hand_history(game_state, f"{player['name']}: shows [{player['hand'][0]} {player['hand'][1]}] ({hand_class})")
 
-        sorted_hands = sorted(player_scores.values(), key=lambda x: x[0])
-        best_score = sorted_hands[0][0]
-        winner_data = [info for info in sorted_hands if info[0] == best_score]
+        best_score = min(score for score, _ in results)
+        winner_data = [info for info in player_scores.values() if info[0] == best_score]
         winners = [{'name': w[2]['name'], 'hand': w[2]['hand'], 'hand_class': w[1]} for w in winner_data]
 
-        # Proper side pot calculation
-        winnings_distributed = distribute_side_pots(players_in_hand, player_scores, game_state)
-        # Ensure full pot is distributed (include previous-round contributions not tracked per-player)
-        total_distributed = sum(winnings_distributed.values())
-        remaining = game_state['pot'] - total_distributed
-        if remaining > 1e-9:
-            # Split remaining among main-pot winners
-            if len(winners) > 0:
-                share = remaining / len(winners)
-                for w in winners:
-                    player_obj = next((p for p in all_players if p['name'] == w['name']), None)
-                    if player_obj is not None:
-                        player_obj['stack'] += share
-                        winnings_distributed[player_obj['name']] = winnings_distributed.get(player_obj['name'], 0) + share
+        lone_winner = winner_data[0][2] if len(winner_data) == 1 else None
+        if lone_winner is not None and all(p['current_bet'] <= lone_winner['current_bet'] for p in players_in_hand):
+            # One winner who covered every bet takes the whole pot, no side pots to build
+            pot_won = game_state['pot']
+            lone_winner['stack'] += pot_won
+            collected = {lone_winner['name']: pot_won}
+        else:
+            # Main pot plus side pots, earlier streets' chips are part of the main pot
+            collected = distribute_side_pots(players_in_hand, player_scores, game_state)
         
-        print(f"DEBUG SHOWDOWN: After side pot distribution:")
-        for p in all_players:
-            print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}, total={p['stack'] + p['current_bet']}")
+        if DEBUG:
+            print(f"DEBUG SHOWDOWN: After side pot distribution:")
+            for p in all_players:
+                print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}, total={p['stack'] + p['current_bet']}")
         
         # Log the winnings
-        for player_name, amount_won in winnings_distributed.items():
+        for player_name, amount_won in collected.items():
             if amount_won > 0:
-                log_to_hand_history(game_state, f"{player_name} collected ${amount_won:.0f} from pot")
+                log_to_hand_history(game_state, f"{player_name} collected ${amount_won} from pot")
 
     # --- Summary Section ---
     log_to_hand_history(game_state, "\n*** SUMMARY ***")
     total_pot_summary = game_state['pot']
-    board_str = " ".join(f"[{c}]" for c in community)
-    log_to_hand_history(game_state, f"Total pot ${total_pot_summary:.0f} | Rake $0.00")
+    board_str = " ".join(community)
+    log_to_hand_history(game_state, f"Total pot ${total_pot_summary} | Rake $0.00")
     if board_str:
         log_to_hand_history(game_state, f"Board [{board_str}]")
 
+    winners_by_name = {w['name']: w for w in winners}
     for i, p in enumerate(all_players):
         summary_line = f"Seat {i+1}: {p['name']}"
         if i == game_state['dealer_pos']:
             summary_line += " (button)"
         
         # Find player's result from the winners list
-        player_result = next((w for w in winners if w['name'] == p['name']), None)
+        player_result = winners_by_name.get(p['name'])
 
-        if p['status'] == 'folded':
+        if p['status'] == FOLDED:
             # Find when they folded
             folded_round = 'before Flop'
             for action in reversed(game_state.get('action_history', [])):
@@ -671,8 +666,7 @@ def showdown(game_state):
             if p['current_bet'] == 0:
                  summary_line += " (didn't bet)"
         elif player_result:
-             net_change = (p['stack'] + p['current_bet']) - initial_stacks[p['name']]
-             summary_line += f" collected (${net_change:.0f}) with {player_result['hand_class']}"
+             summary_line += f" collected (${collected.get(p['name'], 0)}) with {player_result['hand_class']}"
         else: # Lost at showdown
             hand_class = player_scores.get(p['name'], ('', 'lost'))[1]
             summary_line += f" lost with {hand_class}"
@@ -685,44 +679,29 @@ def showdown(game_state):
         player['current_bet'] = 0
     game_state['current_bet'] = 0
     
-    print(f"DEBUG SHOWDOWN: Final state after reset:")
-    for p in all_players:
-        print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}")
-    
+    if DEBUG:
+        print(f"DEBUG SHOWDOWN: Final state after reset:")
+        for p in all_players:
+            print(f"  {p['name']}: stack={p['stack']}, current_bet={p['current_bet']}")
+
+    flush_hand_history(game_state)
     return winners
 
 
-def post_blinds(game_state, small_blind=SMALL_BLIND, big_blind=BIG_BLIND):
-    """Posts small and big blinds with proper heads-up and multi-player positioning rules."""
-    num_players = len(game_state['players'])
-    
-    if num_players == 2:  # Heads-up poker rules
-        # In heads-up, dealer posts small blind and acts first preflop
-        sb_pos = game_state['dealer_pos']  # Dealer posts small blind
-        bb_pos = (game_state['dealer_pos'] + 1) % 2  # Other player posts big blind
-        first_to_act = sb_pos  # Small blind acts first in heads-up preflop
-    else:
-        # Standard multi-player rules
-        sb_pos = (game_state['dealer_pos'] + 1) % num_players
-        bb_pos = (game_state['dealer_pos'] + 2) % num_players
-        first_to_act = (bb_pos + 1) % num_players
+def _post_blind(game_state, player, blind, label):
+    """Moves one blind (capped at the player's stack) into the pot and logs it."""
+    stack = player['stack']
+    amount = blind if blind < stack else stack
+    player['stack'] = stack - amount
+    player['current_bet'] += amount
+    game_state['pot'] += amount
+    log_to_hand_history(game_state, f"{player['name']}: posts {label} ${amount}")
 
-    sb_player = game_state['players'][sb_pos]
-    bb_player = game_state['players'][bb_pos]
-    
-    # Post SB
-    sb_amount = min(sb_player['stack'], small_blind)
-    sb_player['stack'] -= sb_amount
-    sb_player['current_bet'] += sb_amount
-    game_state['pot'] += sb_amount
-    log_to_hand_history(game_state, f"{sb_player['name']}: posts small blind ${sb_amount:.0f}")
-
-    # Post BB
-    bb_amount = min(bb_player['stack'], big_blind)
-    bb_player['stack'] -= bb_amount
-    bb_player['current_bet'] += bb_amount
-    game_state['pot'] += bb_amount
-    log_to_hand_history(game_state, f"{bb_player['name']}: posts big blind ${bb_amount:.0f}")
+def _post_blinds_at(game_state, sb_pos, bb_pos, first_to_act, small_blind, big_blind):
+    """Posts small and big blinds from the given seats and hands the action to first_to_act."""
+    players = game_state['players']
+    _post_blind(game_state, players[sb_pos], small_blind, "small blind")
+    _post_blind(game_state, players[bb_pos], big_blind, "big blind")
 
     game_state['current_bet'] = big_blind
     game_state['last_bet_amount'] = big_blind  # Big blind is the last bet amount
@@ -735,5 +714,8 @@ def post_blinds(game_state, small_blind=SMALL_BLIND, big_blind=BIG_BLIND):
     log_to_hand_history(game_state, f"Dealt to {hero['name']} [{hero['hand'][0]} {hero['hand'][1]}]")
     log_to_hand_history(game_state, f"Dealt to {villain['name']} [{villain['hand'][0]} {villain['hand'][1]}]")
 
-
+def post_blinds(game_state, small_blind=SMALL_BLIND, big_blind=BIG_BLIND):
+    """Posts blinds for the current button using the precomputed seat table."""
+    sb_pos, bb_pos, first_to_act = _BLIND_SEATS[game_state['dealer_pos']]
+    _post_blinds_at(game_state, sb_pos, bb_pos, first_to_act, small_blind, big_blind)
 
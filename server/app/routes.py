@@ -1,13 +1,29 @@
+import threading
+
 from flask import Blueprint, jsonify
 from app.services.analytics_service import AnalyticsService
 
 bp = Blueprint('api', __name__)
 
-try:
-    analytics_service = AnalyticsService()
-except Exception as e:
-    print(f"Failed to initialize AnalyticsService: {e}")
-    analytics_service = None
+# Built once on first use, a failure is remembered so it is not retried and logged again
+analytics_service = None
+_analytics_service_error = None
+_analytics_service_lock = threading.Lock()
+
+def _get_analytics_service():
+    """Returns the analytics service, building it on first use"""
+    global analytics_service, _analytics_service_error
+    if analytics_service is None:
+        with _analytics_service_lock:
+            if analytics_service is None and _analytics_service_error is None:
+                try:
+                    analytics_service = AnalyticsService()
+                except Exception as e:
+                    print(f"Failed to initialize AnalyticsService: {e}")
+                    _analytics_service_error = str(e)
+        if analytics_service is None:
+            raise RuntimeError(f"AnalyticsService unavailable: {_analytics_service_error}")
+    return analytics_service
 
 @bp.after_request
 def after_request(response):
@@ -20,12 +36,18 @@ def after_request(response):
 @bp.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint for Railway deployment"""
+    try:
+        _get_analytics_service()
+        analytics_ok = True
+    except RuntimeError:
+        analytics_ok = False
+
     status = {
         'status': 'OK', 
         'message': 'WebSocket Poker Server Running!',
         'websocket_enabled': True,
         'services': {
-            'analytics_service': analytics_service is not None
+            'analytics_service': analytics_ok
         }
     }
     return jsonify(status)
@@ -34,7 +56,7 @@ def health_check():
 def get_analytics():
     """Get game analytics and statistics"""
     try:
-        analytics_data = analytics_service.get_analytics_report()
+        analytics_data = _get_analytics_service().get_analytics_report()
         return jsonify(analytics_data)
     except Exception as e:
         return jsonify({'error': 'Failed to retrieve analytics'}), 500
@@ -4,11 +4,24 @@ Game Service - Handles all game-related business logic
 import uuid
 import sys
 import os
+import threading
+import functools
+import time
 from typing import Dict, Tuple, Optional, Any
 from app.game.poker import (
     start_new_game, apply_action, betting_round_over, advance_round, 
-    next_player, showdown, prepare_next_hand, deal_remaining_cards
+    next_player, showdown, prepare_next_hand, deal_remaining_cards,
+    to_chips, ACTIVE
 )
+from app.game.config import STARTING_STACK
+
+# Every card string the engine can deal, for validating serialized hands and boards
+_VALID_CARDS = frozenset(r + s for r in '23456789TJQKA' for s in 'shdc')
+
+# Sessions are only kept in memory, so cap them and drop games nobody has touched in a while
+MAX_GAME_SESSIONS = 10000
+SESSION_IDLE_TIMEOUT = 3600  # seconds
+
 # Note: Do not import CFR bot at module import time to avoid requiring PyTorch
 # for users who are not using the CFR AI. We'll import lazily inside the
 # decide_action_cfr_server function.
@@ -200,11 +213,33 @@ def decide_action_cfr_server(game_state: Dict[str, Any]) -> Tuple[str, int]:
         return ("fold", 0)
 
 
+def _with_game_lock(method):
+    """Runs a GameService method while holding the lock of the game it is called for."""
+    @functools.wraps(method)
+    def wrapper(self, game_id, *args, **kwargs):
+        with self._registry_lock:
+            lock = self._game_locks.get(game_id)
+            if lock is not None:
+                self._last_active[game_id] = time.monotonic()
+        if lock is None:
+            # Unknown game, the method itself reports that
+            return method(self, game_id, *args, **kwargs)
+        with lock:
+            return method(self, game_id, *args, **kwargs)
+    return wrapper
+
+
 class GameService:
     """Service class for managing poker game logic and state"""
     
     def __init__(self, analytics_service=None, websocket_service=None):
         self.game_sessions: Dict[str, Dict] = {}
+        # One lock per game so the AI's background turn and the player's request never
+        # mutate the same game_state at once, different games still run in parallel
+        self._game_locks: Dict[str, threading.Lock] = {}
+        self._last_active: Dict[str, float] = {}
+        # Guards adding and evicting sessions, game play only takes the per-game lock
+        self._registry_lock = threading.Lock()
         # Import here to avoid circular imports
         if analytics_service is None:
             from app.game.analytics import analytics
@@ -245,10 +280,11 @@ class GameService:
         Returns:
             Tuple of (game_id, game_state_with_metadata)
         """
-        game_id = str(uuid.uuid4())
+        game_id = uuid.uuid4().hex
         game_state = start_new_game()
         
-        # Store AI type in game state for later use
+        # Store the id and AI type in game state for later use
+        game_state['game_id'] = game_id
         game_state['ai_type'] = ai_type
         
         # Update AI player name and logic based on selected AI type
@@ -275,7 +311,11 @@ class GameService:
             'type': ai_type
         }
         
-        self.game_sessions[game_id] = game_state
+        with self._registry_lock:
+            self._evict_stale_sessions()
+            self._game_locks[game_id] = threading.Lock()
+            self._last_active[game_id] = time.monotonic()
+            self.game_sessions[game_id] = game_state
         
         # Create console logs for game start
         console_logs = [
@@ -300,6 +340,22 @@ class GameService:
         
         return game_id, response
     
+    def _evict_stale_sessions(self) -> None:
+        """Drops idle games, and the least recently used ones if still at MAX_GAME_SESSIONS (caller holds _registry_lock)"""
+        now = time.monotonic()
+        stale = [gid for gid, last in self._last_active.items() if now - last > SESSION_IDLE_TIMEOUT]
+        overflow = len(self._last_active) - len(stale) - MAX_GAME_SESSIONS + 1
+        if overflow > 0:
+            stale_set = set(stale)
+            by_age = sorted((gid for gid in self._last_active if gid not in stale_set),
+                            key=self._last_active.get)
+            stale.extend(by_age[:overflow])
+        for gid in stale:
+            self.game_sessions.pop(gid, None)
+            self._game_locks.pop(gid, None)
+            self._last_active.pop(gid, None)
+    
+    @_with_game_lock
     def get_game_state(self, game_id: str) -> Optional[Dict]:
         """
         Get current game state for a session
@@ -316,6 +372,7 @@ class GameService:
         game_state = self.game_sessions[game_id]
         return self._serialize_game_state(game_state)
     
+    @_with_game_lock
     def execute_player_action(self, game_id: str, action: str, amount: int = 0) -> Dict:
         """
         Execute a player action and process game flow
@@ -359,6 +416,7 @@ class GameService:
         # Process game flow after player action
         return self._process_game_flow(game_state)
     
+    @_with_game_lock
     def execute_ai_turn(self, game_id: str) -> Dict:
         """
         Process AI turn and continue game flow
@@ -380,7 +438,7 @@ class GameService:
         print(f"DEBUG: execute_ai_turn called - current_player: {game_state['current_player']}, AI status: {game_state['players'][1]['status']}")
         
         # Only process if it's AI's turn and AI is active
-        if game_state['current_player'] != 1 or game_state['players'][1]['status'] != 'active':
+        if game_state['current_player'] != 1 or game_state['players'][1]['status'] != ACTIVE:
             print(f"DEBUG: AI can't act - current_player: {game_state['current_player']}, AI status: {game_state['players'][1]['status']}")
             # Not AI's turn, just return current state
             return {
@@ -455,6 +513,7 @@ class GameService:
             ai_action, ai_amount = "fold", 0
             console_logs.append(f"AI ERROR: {str(e)} - defaulting to fold")
         
+        ai_amount = to_chips(ai_amount)  # AI sizing can come back as a float
         console_logs.append(f"AI Action: {ai_action}")
         if ai_amount > 0:
             console_logs.append(f"AI Amount: ${ai_amount}")
@@ -502,6 +561,7 @@ class GameService:
         
         return result
     
+    @_with_game_lock
     def start_new_hand(self, game_id: str) -> Dict:
         """
         Start a new hand in existing game
@@ -521,8 +581,7 @@ class GameService:
         game_state = self.game_sessions[game_id]
         
         # Check if both players have chips
-        active_players = [p for p in game_state['players'] if p['stack'] > 0]
-        if len(active_players) < 2:
+        if sum(p['stack'] > 0 for p in game_state['players']) < 2:
             raise ValueError('Game over - insufficient players with chips')
         
         # Prepare next hand
@@ -531,6 +590,7 @@ class GameService:
         
         return self._serialize_game_state(game_state)
     
+    @_with_game_lock
     def start_new_round(self, game_id: str) -> Dict:
         """
         Start a new round in existing game (reset chip stacks to starting amount)
@@ -550,10 +610,9 @@ class GameService:
         game_state = self.game_sessions[game_id]
         
         # Reset both players' chip stacks to starting amount
-        from app.game.config import STARTING_STACK
         for player in game_state['players']:
             player['stack'] = STARTING_STACK
-            player['status'] = 'active'
+            player['status'] = ACTIVE
         
         # Prepare next hand with reset stacks
         prepare_next_hand(game_state)
@@ -570,30 +629,28 @@ class GameService:
             if betting_round_over(game_state):
                 print(f"DEBUG: Betting round {game_state['betting_round']} is over.")
                 
-                # Check for hand-ending conditions
-                players_in_hand = [p for p in game_state['players'] if p['status'] in ['active', 'all-in']]
-                active_players = [p for p in players_in_hand if p['status'] == 'active']
+                # Check for hand-ending conditions, the engine keeps these counts current
 
                 # Condition 1: Only one player left (everyone else folded)
-                if len(players_in_hand) <= 1:
+                if game_state['in_hand_count'] <= 1:
                     print("DEBUG: Hand ending because only one player remains.")
                     winners = showdown(game_state)
-                    self.analytics.record_hand(game_state, winners, game_state.get('action_history', []))
+                    self.analytics.record_hand(game_state, winners, game_state['action_history'])
                     return {'game_state': self._serialize_game_state(game_state), 'winners': winners, 'hand_over': True, 'message': f"{winners[0]['name']} wins the pot!"}
 
                 # Condition 2: All remaining players are all-in
-                if not active_players:
+                if game_state['active_count'] == 0:
                     print("DEBUG: All players are all-in. Dealing remaining cards for showdown.")
                     deal_remaining_cards(game_state)
                     winners = showdown(game_state)
-                    self.analytics.record_hand(game_state, winners, game_state.get('action_history', []))
+                    self.analytics.record_hand(game_state, winners, game_state['action_history'])
                     return {'game_state': self._serialize_game_state(game_state), 'winners': winners, 'hand_over': True, 'showdown': True, 'all_in_showdown': True, 'message': "All-in showdown!"}
 
                 # Condition 3: River betting is done
                 if game_state['betting_round'] == 'river':
                     print("DEBUG: River betting is over. Proceeding to showdown.")
                     winners = showdown(game_state)
-                    self.analytics.record_hand(game_state, winners, game_state.get('action_history', []))
+                    self.analytics.record_hand(game_state, winners, game_state['action_history'])
                     return {'game_state': self._serialize_game_state(game_state), 'winners': winners, 'hand_over': True, 'showdown': True, 'message': "Showdown!"}
                 
                 # If no hand-ending condition is met, advance to the next street.
@@ -612,21 +669,28 @@ class GameService:
     
     def _set_first_to_act(self, game_state: Dict) -> None:
         """Set the first active player to act for a new betting round"""
-        num_players = len(game_state['players'])
+        players = game_state['players']
+        num_players = len(players)
         
         # In heads-up poker, postflop the button/dealer acts first
         if num_players == 2:
-            # Heads-up: dealer acts first postflop
-            first_pos = game_state['dealer_pos']
+            # Heads-up: dealer acts first postflop, otherwise the other seat, no scan needed
+            dealer_pos = game_state['dealer_pos']
+            dealer, other = players[dealer_pos], players[dealer_pos ^ 1]
+            if dealer['status'] == ACTIVE and dealer['stack'] > 0:
+                game_state['current_player'] = dealer_pos
+                return
+            if other['status'] == ACTIVE and other['stack'] > 0:
+                game_state['current_player'] = dealer_pos ^ 1
+                return
         else:
             # Multi-way: player after dealer acts first
             first_pos = (game_state['dealer_pos'] + 1) % num_players
-        
-        for i in range(num_players):
-            pos = (first_pos + i) % num_players
-            if game_state['players'][pos]['status'] == 'active' and game_state['players'][pos]['stack'] > 0:
-                game_state['current_player'] = pos
-                return
+            for i in range(num_players):
+                pos = (first_pos + i) % num_players
+                if players[pos]['status'] == ACTIVE and players[pos]['stack'] > 0:
+                    game_state['current_player'] = pos
+                    return
         
         # If no active players found, something is wrong
         game_state['current_player'] = 0
@@ -651,11 +715,12 @@ class GameService:
     
     def _serialize_game_state(self, game_state: Dict) -> Dict:
         """Convert game state to JSON-safe format for frontend"""
+        # Every key read here is set by start_new_game or create_new_game
         # Validate card data before serialization
         self._validate_card_data(game_state)
         
         serialized = {
-            'game_id': game_state.get('game_id'),
+            'game_id': game_state['game_id'],
             'player_hand': game_state['players'][0]['hand'],
             'community': game_state['community'],
             'pot': game_state['pot'],
@@ -671,11 +736,11 @@ class GameService:
             'current_player': game_state['current_player'],
             'betting_round': game_state['betting_round'],
             'current_bet': game_state['current_bet'],
-            'last_bet_amount': game_state.get('last_bet_amount', 0),
-            'action_history': game_state.get('action_history', []),
+            'last_bet_amount': game_state['last_bet_amount'],
+            'action_history': game_state['action_history'],
             'dealer_pos': game_state['dealer_pos'],
-            'big_blind': game_state.get('big_blind', 10),  # Include big blind for frontend calculations
-            'ai_info': game_state.get('ai_info', {'name': 'Bladework', 'logic': 'Hard Coded', 'type': 'bladework_v2'})
+            'big_blind': game_state['big_blind'],  # Include big blind for frontend calculations
+            'ai_info': game_state['ai_info']
         }
         
         return serialized
@@ -686,6 +751,9 @@ class GameService:
         valid_suits = {'s', 'h', 'd', 'c'}
         
         def validate_card(card: str, context: str) -> None:
+            # Valid cards are one set lookup, the checks below only work out the error message
+            if isinstance(card, str) and card in _VALID_CARDS:
+                return
             if not isinstance(card, str) or len(card) != 2:
                 raise ValueError(f"Invalid card format in {context}: {card}")
             
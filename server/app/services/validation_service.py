@@ -3,6 +3,9 @@ Validation Service - Handles input validation and business rule enforcement
 """
 from typing import Dict, Any, Tuple, Optional
 
+from app.game.config import BIG_BLIND
+from app.game.poker import IN_HAND
+
 
 class ValidationService:
     """Service class for validating game inputs and business rules"""
@@ -90,14 +93,13 @@ class ValidationService:
         # Check minimum raise requirements (this logic should match poker.py)
         current_bet = game_state.get('current_bet', 0)
         last_bet_amount = game_state.get('last_bet_amount', 0)
-        big_blind = 20  # From config
         
         if current_bet == 0:
             # First bet of the round - minimum is big blind
-            min_raise = big_blind
+            min_raise = BIG_BLIND
         else:
             # Must raise by at least the size of the last bet/raise
-            min_raise = current_bet + max(last_bet_amount, big_blind)
+            min_raise = current_bet + max(last_bet_amount, BIG_BLIND)
         
         if amount < min_raise:
             return False, f"Minimum raise is ${min_raise}"
@@ -126,7 +128,7 @@ class ValidationService:
             return False, "Invalid player index"
         
         player = game_state['players'][expected_player]
-        if player['status'] not in ['active', 'all-in']:
+        if player['status'] not in IN_HAND:
             return False, "Player is not active in this hand"
         
         return True, ""
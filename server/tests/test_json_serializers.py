@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests that the orjson encoders in app/__init__.py decode to the same values as
+the stdlib encoders they replace
+
+You can run this file directly or through pytest
+"""
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+pytest.importorskip('orjson')
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app import ORJSONProvider, ORJSONSocketSerializer
+from app.game import poker
+from app.services.game_service import GameService
+
+
+class Chips(float):
+    """Stands in for a numpy float coming out of the CFR bot"""
+
+
+def game_payload():
+    """A serialized game state as it is emitted to the client"""
+    game_state = poker.start_new_game(hand_history=False)
+    game_state['game_id'] = 'test-game'
+    game_state['ai_info'] = {'name': 'CFR Bot', 'logic': 'Trained CFR', 'type': 'cfr'}
+    game_state['action_history'] = [
+        {'player': 'CFR Bot', 'action': 'raise', 'amount': Chips(25.0), 'round': 'preflop'},
+    ]
+    payload = GameService()._serialize_game_state(game_state)
+    payload['players'][1]['stack'] = Chips(975.5)
+    return {'game_state': payload, 'hand_over': False, 'message': 'Bladework raises – $25'}
+
+
+def test_socket_serializer_matches_stdlib():
+    """Socket.IO packets decode the same as with the stdlib json module"""
+    payload = game_payload()
+    encoded = ORJSONSocketSerializer.dumps(payload, separators=(',', ':'))
+    assert json.loads(encoded) == json.loads(json.dumps(payload, separators=(',', ':')))
+
+
+def test_provider_matches_default_provider():
+    """jsonify output decodes the same as with Flask's default provider"""
+    app = Flask(__name__)
+    payload = game_payload()
+    encoded = ORJSONProvider(app).dumps(payload)
+    assert json.loads(encoded) == json.loads(DefaultJSONProvider(app).dumps(payload))
+
+
+def test_stdlib_fallback():
+    """Integers past 64 bits are handed to the stdlib encoder, unknown types still raise"""
+    assert json.loads(ORJSONSocketSerializer.dumps({'pot': 2 ** 70})) == {'pot': 2 ** 70}
+    with pytest.raises(TypeError):
+        ORJSONSocketSerializer.dumps({'pot': object()})
+
+
+if __name__ == '__main__':
+    test_socket_serializer_matches_stdlib()
+    test_provider_matches_default_provider()
+    test_stdlib_fallback()
+    print("All serializer tests passed")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the core heads-up game engine in app/game/poker.py
+
+You can run this file directly or through pytest
+"""
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.game import poker
+from app.game.config import SMALL_BLIND, BIG_BLIND
+
+
+def new_game(dealer_pos=0):
+    """Start a game without hand history and re-post blinds for a fixed dealer"""
+    game_state = poker.start_new_game(hand_history=False)
+    # prepare_next_hand moves the button one seat along
+    game_state['dealer_pos'] = dealer_pos ^ 1
+    poker.prepare_next_hand(game_state)
+    return game_state
+
+
+def test_heads_up_blinds():
+    """Dealer posts the small blind and acts first preflop"""
+    for dealer in (0, 1):
+        game_state = new_game(dealer)
+        assert game_state['dealer_pos'] == dealer
+        sb, bb = game_state['players'][dealer], game_state['players'][dealer ^ 1]
+        assert sb['current_bet'] == SMALL_BLIND
+        assert bb['current_bet'] == BIG_BLIND
+        assert game_state['pot'] == SMALL_BLIND + BIG_BLIND
+        assert game_state['current_player'] == dealer
+
+
+def test_next_player_heads_up():
+    """Turn passes to the other seat only while it is still active"""
+    game_state = new_game(0)
+    poker.next_player(game_state)
+    assert game_state['current_player'] == 1
+    game_state['players'][0]['status'] = 'all-in'
+    poker.next_player(game_state)
+    assert game_state['current_player'] == 1
+
+
+def test_split_pot_odd_chip():
+    """Split pots stay whole chips, odd chip goes left of the button"""
+    game_state = new_game(0)
+    players = game_state['players']
+    for p in players:
+        p['hand'] = ['2c', '3d']
+    game_state['community'] = ['Ah', 'Ks', '9d', '8c', '7h']
+    game_state['pot'] = 15
+    for p in players:
+        p['current_bet'] = 0
+    stacks = [p['stack'] for p in players]
+    poker.showdown(game_state)
+    assert [p['stack'] - stack for p, stack in zip(players, stacks)] == [7, 8]
+
+
+def test_to_chips_rounds_half_up():
+    """AI float sizing becomes whole int chips, halves round up"""
+    class Chips(float):
+        pass
+    for amount, chips in ((2.5, 3), (3.5, 4), (Chips(24.5), 25), (24.4, 24), (30, 30)):
+        assert poker.to_chips(amount) == chips
+        assert type(poker.to_chips(amount)) is int
+
+
+def test_side_pots_core():
+    """Short all-in only wins the main pot, the rest goes to the best covering hand"""
+    pot_sizes, won = poker._compute_side_pots([100, 300, 300], [1, 5, 3], [0, 1, 2])
+    assert pot_sizes == [300, 400]
+    assert won == [300, 0, 400]
+    # Tied side pot with an odd chip goes to the seat closest to the button's left
+    pot_sizes, won = poker._compute_side_pots([51, 75, 75], [9, 2, 2], [2, 1, 0])
+    assert pot_sizes == [153, 48]
+    assert won == [0, 100, 101]
+    # Chips from earlier streets join the main pot
+    pot_sizes, won = poker._compute_side_pots([0, 40], [2, 1], [1, 0], dead_money=60)
+    assert pot_sizes == [60, 40]
+    assert won == [0, 100]
+
+
+def test_betting_round_over_heads_up():
+    """Round closes only once both players acted and the last raise was answered"""
+    game_state = new_game(0)
+    poker.apply_action(game_state, 'call')
+    assert not poker.betting_round_over(game_state)
+    poker.next_player(game_state)
+    poker.apply_action(game_state, 'raise', 30)
+    assert not poker.betting_round_over(game_state)
+    poker.next_player(game_state)
+    poker.apply_action(game_state, 'call')
+    assert poker.betting_round_over(game_state)
+    poker.advance_round(game_state)
+    assert game_state['actions_this_round_mask'] == 0
+    assert not poker.betting_round_over(game_state)
+
+
+if __name__ == "__main__":
+    test_heads_up_blinds()
+    test_next_player_heads_up()
+    test_split_pot_odd_chip()
+    test_to_chips_rounds_half_up()
+    test_side_pots_core()
+    test_betting_round_over_heads_up()
+    print("All engine tests passed")